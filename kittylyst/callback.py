@@ -59,10 +59,11 @@ class CriterionCallback(Callback):
 class AccuracyCallback(Callback):
     def on_batch_end(self, runner: "IRunner"):
         logits, targets = runner.output["logits"], runner.input["targets"]
-        accuracy = [
-            (yi > 0) == (li.data > 0) for yi, li in zip(targets, logits)
-        ]
-        accuracy = sum(accuracy) / len(accuracy)
+        logits = np.fromiter(
+            (li.data for li in logits), dtype=np.float64, count=len(logits)
+        )
+        targets = np.asarray(targets)
+        accuracy = float(np.mean((targets > 0) == (logits > 0)))
         runner.batch_metrics.update({"accuracy": accuracy})
 
 
@@ -73,7 +74,7 @@ class OptimizerCallback(Callback):
 
     def on_batch_end(self, runner: "IRunner"):
         if runner.is_train_loader:
-            runner.model.zero_grad()
+            runner.optimizer.zero_grad()
             runner.batch_metrics[self.metric_key].backward()
             runner.optimizer.step()
 
@@ -85,14 +86,16 @@ class SchedulerCallback(Callback):
 
 class LoggerCallback(Callback):
     def on_batch_end(self, runner: "IRunner"):
+        loader_metrics = runner.loader_metrics
         for k, v in runner.batch_metrics.items():
-            runner.loader_metrics[k].append(unvalue(v))
+            loader_metrics[k].append(unvalue(v))
 
     def on_loader_end(self, runner: "IRunner"):
-        metrics = {k: np.mean(v) for k, v in runner.loader_metrics.items()}
-        msg = (
+        metrics = {
+            k: sum(v) / len(v) for k, v in runner.loader_metrics.items()
+        }
+        print(
             f"{runner.epoch + 1}/{runner.num_epochs}"
-            + f" Epoch ({runner.loader_name}) "
-            + format_metrics(metrics)
+            f" Epoch ({runner.loader_name}) "
+            f"{format_metrics(metrics)}"
         )
-        print(msg)
@@ -44,10 +44,16 @@ class MicroOptimizer:
     def __init__(self, model, lr=1e-3):
         self.model = model
         self.lr = lr
+        self.params = model.parameters()
+
+    def zero_grad(self):
+        for p in self.params:
+            p.grad = 0
 
     def step(self):
-        for p in self.model.parameters():
-            p.data -= self.lr * p.grad
+        lr = self.lr
+        for p in self.params:
+            p.data -= lr * p.grad
 
 
 class MicroScheduler: